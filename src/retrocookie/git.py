@@ -11,6 +11,7 @@ from dataclasses import field
 from pathlib import Path
 from typing import Any
 from typing import cast
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
@@ -46,6 +47,10 @@ def git(
         raise CommandError(message) from error
 
 
+# Revision ranges and options are passed to git rev-list, see gitrevisions(7).
+RANGE_PATTERN = re.compile(r"\.\.|\^[!@-]|^[-^]")
+
+
 VERSION_PATTERN = re.compile(
     r"""
     (?P<major>\d+)\.
@@ -88,6 +93,7 @@ class Version:
         )
 
 
+@functools.lru_cache(maxsize=None)
 def version() -> Version:
     """Return the git version."""
     text = git("version").stdout.strip()
@@ -177,11 +183,31 @@ class Repository:
 
     def parse_revisions(self, *revisions: str) -> List[str]:
         """Parse revisions using the format specified in gitrevisions(7)."""
+        if not any(RANGE_PATTERN.search(revision) for revision in revisions):
+            with contextlib.suppress(KeyError, ValueError, pygit2.GitError):
+                return self._lookup_commits(*revisions)
+
         process = self.git("rev-list", "--no-walk", *revisions)
         result = process.stdout.split()
         result.reverse()
         return result
 
+    def _lookup_commits(self, *revisions: str) -> List[str]:
+        """Resolve single revisions in the order used by ``git rev-list``."""
+        commits: Dict[str, Any] = {}
+        for revision in revisions:
+            commit = self.repo.revparse_single(revision).peel(pygit2.Commit)
+            commits.setdefault(str(commit.id), commit)
+
+        # git rev-list emits the newest commit first, and commits with the same
+        # time in argument order. Sorting the reversed commits by ascending time
+        # produces the reverse of that order in a single stable sort.
+        result = sorted(
+            reversed([*commits.values()]),
+            key=lambda commit: cast(int, commit.commit_time),
+        )
+        return [str(commit.id) for commit in result]
+
     def lookup_replacement(self, commit: str) -> str:
         """Lookup the replace ref for the given commit."""
         refname = f"refs/replace/{commit}"
@@ -235,8 +261,62 @@ class Repository:
         self.repo.create_commit(refname, author, committer, message, tree, parents)
 
     def cherrypick(self, *refs: str) -> None:
-        """Cherry-pick the given commits."""
-        self.git("cherry-pick", *refs)
+        """Cherry-pick the given commits.
+
+        Commits are applied in memory while they apply cleanly. Starting with
+        the first commit that conflicts, is empty, or is a merge, the remaining
+        commits are passed to ``git cherry-pick``. Conflicts are left in the
+        worktree for resolution with ``git cherry-pick --continue``.
+        """
+        try:
+            commits = [commit for ref in refs for commit in self.parse_revisions(ref)]
+            remaining = self._cherrypick(*commits)
+        except (KeyError, ValueError, pygit2.GitError) as error:
+            raise CommandError(f"cherry-pick failed: {error}") from error
+
+        if remaining:
+            self.git("cherry-pick", *remaining)
+
+    def _cherrypick(self, *commits: str) -> List[str]:
+        """Apply commits in memory, and return those left for git."""
+        head = self.repo.head
+        refname = head.name
+        target = head.target
+        tree = self.repo[target].tree
+        committer = self.repo.default_signature
+        applied = 0
+
+        for revision in commits:
+            commit = self.repo[revision]
+            if len(commit.parents) > 1:
+                break
+
+            base = (
+                commit.parents[0].tree
+                if commit.parents
+                else self.repo[self.repo.TreeBuilder().write()]
+            )
+            index = self.repo.merge_trees(base, tree, commit)
+            if index.conflicts is not None:
+                break
+
+            result = self.repo[index.write_tree(self.repo)]
+            if result.id == tree.id:
+                break
+
+            tree = result
+            target = self.repo.create_commit(
+                None, commit.author, committer, commit.message, tree.id, [target]
+            )
+            applied += 1
+
+        if applied:
+            if not self.repo.is_bare:
+                self.repo.checkout_tree(tree)
+
+            self.repo.references[refname].set_target(target)
+
+        return list(commits[applied:])
 
     @contextmanager
     def worktree(
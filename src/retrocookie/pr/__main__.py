@@ -2,12 +2,16 @@
 import contextlib
 import subprocess  # noqa: S404
 import webbrowser
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Collection
 from typing import Iterator
 from typing import List
 from typing import NoReturn
 from typing import Optional
+from typing import Tuple
 
 import appdirs
 import click
@@ -73,18 +77,50 @@ def collect(errors: List[Error]) -> ExceptionHandler:
     return _
 
 
-def register_pull_request_viewer(*, bus: Bus) -> None:
-    """Register an event handler for viewing pull requests in a browser."""
+def register_pull_request_viewer(
+    *, bus: Bus, executor: Executor
+) -> List[Tuple[str, "Future[bool]"]]:
+    """Register an event handler for viewing pull requests in a browser.
+
+    The browser is launched from the executor, so the import of the next pull
+    request does not wait for it. Return the URLs with their pending futures.
+    """
+    views: List[Tuple[str, "Future[bool]"]] = []
+
+    def _view(url: str) -> None:
+        views.append((url, executor.submit(webbrowser.open, url)))
 
     @bus.events.subscribe
     def _(event: events.PullRequestCreated) -> None:
-        webbrowser.open(event.template_pull.html_url)
+        _view(event.template_pull.html_url)
 
     @bus.contexts.subscribe
     @contextmanager
     def _(event: events.UpdatePullRequest) -> Iterator[None]:
         yield
-        webbrowser.open(event.template_pull.html_url)
+        _view(event.template_pull.html_url)
+
+    return views
+
+
+@contextmanager
+def pull_request_viewer(*, bus: Bus) -> Iterator[None]:
+    """View imported pull requests in a browser.
+
+    On exit, wait for the browsers to launch, and report failures on the bus.
+    """
+    views: List[Tuple[str, "Future[bool]"]] = []
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            views = register_pull_request_viewer(bus=bus, executor=executor)
+            yield
+    finally:
+        for url, future in views:
+            error = future.exception()
+            if error is not None:
+                bus.events.publish(events.BrowserFailed(url, str(error)))
+            elif not future.result():
+                bus.events.publish(events.BrowserFailed(url, "No browser found."))
 
 
 @click.command()
@@ -156,9 +192,6 @@ def main(
     bus = Bus()
     console.start(bus=bus)
 
-    if open:  # pragma: no cover
-        register_pull_request_viewer(bus=bus)
-
     errors: List[Error] = []
 
     corehandler = (
@@ -169,7 +202,10 @@ def main(
     mainerrorhandler = corehandler >> (exithandler if not debug else nullhandler)
     nestederrorhandler = (corehandler >> collect(errors)) if keep_going else nullhandler
 
-    with mainerrorhandler:
+    with contextlib.ExitStack() as stack, mainerrorhandler:
+        if open:
+            stack.enter_context(pull_request_viewer(bus=bus))
+
         user_cache_dir = appdirs.user_cache_dir(appauthor=appname, appname=appname)
         cache = Cache(Path(user_cache_dir))
         api = github.API.login(token or get_token(cache), bus=bus)
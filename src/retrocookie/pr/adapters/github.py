@@ -1,8 +1,10 @@
 """GitHub interface."""
 from __future__ import annotations
 
+import contextlib
 from typing import AbstractSet
 from typing import cast
+from typing import Dict
 from typing import Iterable
 from typing import Optional
 from typing import Set
@@ -16,6 +18,7 @@ from retrocookie.pr import events
 from retrocookie.pr.base.bus import Bus
 from retrocookie.pr.base.exceptionhandlers import ExceptionHandler
 from retrocookie.pr.base.exceptionhandlers import exceptionhandler
+from retrocookie.pr.list import MAX_DIRECT_LOOKUPS
 
 
 class PullRequest:
@@ -30,6 +33,8 @@ class PullRequest:
     ) -> None:
         """Initialize."""
         self._pull_request = pull_request
+        self._issue: Optional[github3.issues.Issue] = None
+        self._labels: Optional[Set[str]] = None
 
     @property
     def number(self) -> int:
@@ -64,13 +69,21 @@ class PullRequest:
     @property
     def labels(self) -> Set[str]:
         """The labels associated with the pull request."""
-        issue = self._pull_request.issue()
-        return {label.name for label in issue.labels()}
+        if self._labels is None:
+            self._labels = {label.name for label in self._get_issue().labels()}
+        return set(self._labels)
 
     def update(self, title: str, body: Optional[str], labels: AbstractSet[str]) -> None:
         """Update the pull request."""
         self._pull_request.update(title=title, body=body)
-        self._pull_request.issue().replace_labels([*labels])
+        self._get_issue().replace_labels([*labels])
+        self._labels = set(labels)
+
+    def _get_issue(self) -> github3.issues.Issue:
+        """Return the issue for the pull request, fetching it only once."""
+        if self._issue is None:
+            self._issue = self._pull_request.issue()
+        return self._issue
 
 
 class Repository:
@@ -83,6 +96,10 @@ class Repository:
         self._repository = repository
         self._token = token
         self._bus = bus
+        self._pull_requests: Dict[int, PullRequest] = {}
+        self._pull_requests_by_head: Dict[str, Optional[PullRequest]] = {}
+        self._head_lookups = 0
+        self._listed_heads = False
 
     @property
     def owner(self) -> str:
@@ -111,19 +128,46 @@ class Repository:
 
     def pull_request(self, number: int) -> PullRequest:
         """Return pull request identified by the given number."""
+        with contextlib.suppress(KeyError):
+            return self._pull_requests[number]
+
         with self._bus.events.reraise(
             events.PullRequestNotFound(str(number)),
             when=github3.exceptions.NotFoundError,
         ):
             pull_request = self._repository.pull_request(number)
 
-        return PullRequest(pull_request)
+        result = PullRequest(pull_request)
+        self._pull_requests[number] = result
+        return result
 
     def pull_request_by_head(self, head: str) -> Optional[PullRequest]:
-        """Return pull request for the given head."""
-        for pull_request in self._repository.pull_requests(head=head):
-            return PullRequest(pull_request)
-        return None
+        """Return pull request for the given head.
+
+        The first few heads are queried individually. After that, the open pull
+        requests are listed once, which costs fewer requests for many heads.
+        """
+        with contextlib.suppress(KeyError):
+            return self._pull_requests_by_head[head]
+
+        if self._head_lookups < MAX_DIRECT_LOOKUPS:
+            self._head_lookups += 1
+            result = None
+            for pull_request in self._repository.pull_requests(head=head):
+                result = PullRequest(pull_request)
+                break
+
+            self._pull_requests_by_head[head] = result
+            return result
+
+        if not self._listed_heads:
+            self._listed_heads = True
+            for pull_request in self._repository.pull_requests(state="open"):
+                self._pull_requests_by_head.setdefault(
+                    pull_request.head.label, PullRequest(pull_request)
+                )
+
+        return self._pull_requests_by_head.setdefault(head, None)
 
     def pull_requests(self) -> Iterable[PullRequest]:
         """Pull requests open in the repository."""
@@ -156,7 +200,10 @@ class Repository:
             with attempt:
                 pull_request.issue().add_labels(*labels)
 
-        return PullRequest(pull_request)
+        result = PullRequest(pull_request)
+        self._pull_requests[result.number] = result
+        self._pull_requests_by_head[head] = result
+        return result
 
 
 class API:
@@ -167,6 +214,8 @@ class API:
         self._github = github
         self._token = token
         self._bus = bus
+        self._me: Optional[str] = None
+        self._repositories: Dict[str, Repository] = {}
 
     @classmethod
     def login(cls, token: str, *, bus: Bus) -> API:
@@ -177,18 +226,25 @@ class API:
     @property
     def me(self) -> str:
         """Return the login of the authenticated user."""
-        return cast(str, self._github.me().login)
+        if self._me is None:
+            self._me = cast(str, self._github.me().login)
+        return self._me
 
     def repository(self, owner: str, name: str) -> Repository:
         """Return the repository with the given owner and name."""
         fullname = "/".join([owner, name])
+        with contextlib.suppress(KeyError):
+            return self._repositories[fullname]
+
         with self._bus.events.reraise(
             events.RepositoryNotFound(fullname),
             when=github3.exceptions.NotFoundError,
         ):
             _repository = self._github.repository(owner, name)
 
-        return Repository(_repository, token=self._token, bus=self._bus)
+        repository = Repository(_repository, token=self._token, bus=self._bus)
+        self._repositories[fullname] = repository
+        return repository
 
 
 def errorhandler(*, bus: Bus) -> ExceptionHandler:
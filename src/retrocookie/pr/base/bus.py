@@ -18,6 +18,22 @@ to determine which handlers to invoke when an event is published.
 >>> bus.events.publish(Timber())
 Timber!
 
+Handlers subscribed to an event class also receive instances of its subclasses.
+The same applies to contexts, described below.
+
+>>> class Tree(Event):
+...     pass
+...
+>>> class Oak(Tree):
+...     pass
+...
+>>> def grow(event: Tree):
+...     print(f"{type(event).__name__} grows.")
+...
+>>> bus.events.subscribe(grow)
+>>> bus.events.publish(Oak())
+Oak grows.
+
 Events can be raised on the bus. A raised event is wrapped in an :class:Error
 exception, causing the stack to unwind until an error handler is encounted.
 
@@ -60,14 +76,12 @@ copy: file a
 copy: file b
 copy complete.
 """
-from collections import defaultdict
 from contextlib import ExitStack
 from typing import Any
 from typing import ContextManager
 from typing import Dict
 from typing import get_type_hints
 from typing import Iterator
-from typing import List
 from typing import NoReturn
 from typing import Tuple
 from typing import Type
@@ -91,10 +105,14 @@ __all__ = [
 class Event:
     """An event can be published on the bus, and subscribed to."""
 
+    __slots__ = ()
+
 
 class Context:
     """A context is an event with a duration."""
 
+    __slots__ = ()
+
 
 class Error(Exception):
     """An exception for transporting an event."""
@@ -108,6 +126,15 @@ E = TypeVar("E", bound=Event, contravariant=True)
 C = TypeVar("C", bound=Context, contravariant=True)
 
 
+def _get_event_type(handler: Any) -> Any:
+    """Return the type annotation of the handler's parameter."""
+    name, hint = next(iter(handler.__annotations__.items()))
+    if isinstance(hint, str):
+        # Only resolve forward references and postponed annotations.
+        hint = get_type_hints(handler)[name]
+    return hint
+
+
 class _EventHandler(Protocol[E]):
     """Handler for an event."""
 
@@ -125,23 +152,41 @@ class _ContextHandler(Protocol[C]):
 class _Events:
     """Publish and subscribe to events."""
 
+    __slots__ = ("handlers", "_resolved")
+
     def __init__(self) -> None:
         """Initialize."""
         self.handlers: Dict[
             Type[Event],
-            List[_EventHandler[Any]],
-        ] = defaultdict(list)
+            Tuple[_EventHandler[Any], ...],
+        ] = {}
+        self._resolved: Dict[
+            Type[Event],
+            Tuple[_EventHandler[Any], ...],
+        ] = {}
 
     def publish(self, event: Event) -> None:
         """Publish an event on the bus."""
-        handlers = self.handlers[type(event)]
-        for handler in handlers:
+        for handler in self._resolve(type(event)):
             handler(event)
 
+    def _resolve(self, event_type: Type[Event]) -> Tuple[_EventHandler[Any], ...]:
+        """Return the handlers for the event type and its base classes."""
+        try:
+            return self._resolved[event_type]
+        except KeyError:
+            handlers = self._resolved[event_type] = tuple(
+                handler
+                for cls in event_type.__mro__
+                for handler in self.handlers.get(cls, ())
+            )
+            return handlers
+
     def subscribe(self, handler: _EventHandler[E]) -> _EventHandler[E]:
         """Subscribe to an event."""
-        event_type = next(hint for hint in get_type_hints(handler).values())
-        self.handlers[event_type].append(handler)
+        event_type = _get_event_type(handler)
+        self.handlers[event_type] = (*self.handlers.get(event_type, ()), handler)
+        self._resolved.clear()
         return handler
 
     def raise_(self, event: Event) -> NoReturn:
@@ -179,32 +224,60 @@ class _Events:
 class _Contexts:
     """Publish and subscribe to contexts."""
 
+    __slots__ = ("handlers", "_resolved")
+
     def __init__(self) -> None:
         """Initialize."""
         self.handlers: Dict[
             Type[Context],
-            List[_ContextHandler[Any]],
-        ] = defaultdict(list)
+            Tuple[_ContextHandler[Any], ...],
+        ] = {}
+        self._resolved: Dict[
+            Type[Context],
+            Tuple[_ContextHandler[Any], ...],
+        ] = {}
 
     @contextmanager
     def publish(self, event: Context) -> Iterator[None]:
         """Publish a context."""
-        handlers = self.handlers[type(event)]
-        with ExitStack() as stack:
-            for handler in handlers:
-                stack.enter_context(handler(event))
+        handlers = self._resolve(type(event))
+        if not handlers:
             yield
+        elif len(handlers) == 1:
+            [handler] = handlers
+            with handler(event):
+                yield
+        else:
+            with ExitStack() as stack:
+                for handler in handlers:
+                    stack.enter_context(handler(event))
+                yield
+
+    def _resolve(self, context_type: Type[Context]) -> Tuple[_ContextHandler[Any], ...]:
+        """Return the handlers for the context type and its base classes."""
+        try:
+            return self._resolved[context_type]
+        except KeyError:
+            handlers = self._resolved[context_type] = tuple(
+                handler
+                for cls in context_type.__mro__
+                for handler in self.handlers.get(cls, ())
+            )
+            return handlers
 
     def subscribe(self, handler: _ContextHandler[C]) -> _ContextHandler[C]:
         """Subscribe to a context."""
-        event_type = next(hint for hint in get_type_hints(handler).values())
-        self.handlers[event_type].append(handler)
+        event_type = _get_event_type(handler)
+        self.handlers[event_type] = (*self.handlers.get(event_type, ()), handler)
+        self._resolved.clear()
         return handler
 
 
 class Bus:
     """Event bus."""
 
+    __slots__ = ("events", "contexts")
+
     def __init__(self) -> None:
         """Initialize."""
         self.events = _Events()
@@ -100,7 +100,9 @@ associative, this makes exception handlers with composition a simple monoid_.
 from __future__ import annotations
 
 import contextlib
+import sys
 from types import TracebackType
+from typing import Any
 from typing import Callable
 from typing import Generic
 from typing import get_type_hints
@@ -179,6 +181,13 @@ class ExceptionHandler(contextlib.ContextDecorator):
         As a mnemonic, the operator points in the direction of exception flow.
         In ``a << b``, the right operand sees the exception first.
         """
+        # The identity element does not need to be part of the composition.
+        if other is nullhandler:
+            return self
+
+        if self is nullhandler:
+            return other
+
         return _Compose(self, other)
 
     def __rshift__(self, other: ExceptionHandler) -> ExceptionHandler:
@@ -206,22 +215,28 @@ class _Compose(ExceptionHandler):
     def __init__(self, first: ExceptionHandler, second: ExceptionHandler) -> None:
         """Initialize."""
         # Reduce object count in expressions like ``a << b << c``.
-        self.stacks: List[contextlib.ExitStack] = []
-        self.handlers: List[ExceptionHandler] = [
+        self.handlers: Tuple[ExceptionHandler, ...] = tuple(
             handler
             for arg in (first, second)
             for handler in (arg.handlers if isinstance(arg, _Compose) else [arg])
-        ]
+        )
+        # Handlers that do something on entry are entered using an ExitStack.
+        self.stacks: Optional[List[contextlib.ExitStack]] = (
+            []
+            if any(
+                type(handler).__enter__ is not ExceptionHandler.__enter__
+                for handler in self.handlers
+            )
+            else None
+        )
 
     def __enter__(self) -> None:
         """Enter the runtime context."""
-        stack = contextlib.ExitStack()
-        self.stacks.append(stack)
-
-        for handler in self.handlers:
-            stack.enter_context(handler)
-
-        stack.__enter__()
+        if self.stacks is not None:
+            with contextlib.ExitStack() as stack:
+                for handler in self.handlers:
+                    stack.enter_context(handler)
+                self.stacks.append(stack.pop_all())
 
     def __exit__(
         self,
@@ -229,9 +244,58 @@ class _Compose(ExceptionHandler):
         exception: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
-        """Exit the runtime context."""
-        stack = self.stacks.pop()
-        return stack.__exit__(exception_type, exception, traceback)
+        """Exit the runtime context.
+
+        This unwinds the handlers like nested ``with`` blocks would. If entering
+        the handlers is a noop, no :class:`contextlib.ExitStack` is allocated.
+        """
+        if self.stacks is not None:
+            stack = self.stacks.pop()
+            return stack.__exit__(exception_type, exception, traceback)
+
+        original = exception
+        frame_exception = sys.exc_info()[1]
+
+        for handler in reversed(self.handlers):
+            try:
+                if handler.__exit__(exception_type, exception, traceback):
+                    exception_type = exception = traceback = None
+            except BaseException as error:
+                _fix_exception_context(error, exception, frame_exception)
+                exception_type, exception = type(error), error
+                traceback = error.__traceback__
+
+        if exception is None:
+            return original is not None
+
+        if exception is original:
+            return None
+
+        # Preserve the context set up above, which ``raise`` would replace.
+        context = exception.__context__
+        try:
+            raise exception
+        except BaseException:
+            exception.__context__ = context
+            raise
+
+
+def _fix_exception_context(
+    exception: BaseException,
+    context: Optional[BaseException],
+    frame_exception: Optional[BaseException],
+) -> None:
+    """Chain the exception to its context, like :class:`contextlib.ExitStack`."""
+    # Find the end of the chain, which may already be correct.
+    while True:
+        current = exception.__context__
+        if current is None or current is context:
+            return
+        if current is frame_exception:
+            break
+        exception = current
+
+    exception.__context__ = context
 
 
 E = TypeVar("E", bound=BaseException, contravariant=True)
@@ -251,9 +315,18 @@ class _Decorator(Generic[E], ExceptionHandler):
         callback: _Callback[E],
         *exception_types: Type[BaseException],
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        Without exception types, the type annotation of the callback is
+        resolved when the first exception is seen.
+        """
         self.callback = callback
-        self.exception_types = exception_types
+        # A single type avoids scanning a tuple in ``isinstance``.
+        self.exception_types: Union[
+            None, Type[BaseException], Tuple[Type[BaseException], ...]
+        ] = (
+            exception_types[0] if len(exception_types) == 1 else exception_types or None
+        )
 
     def __exit__(
         self,
@@ -262,16 +335,35 @@ class _Decorator(Generic[E], ExceptionHandler):
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
         """Exit the context."""
+        if exception is None:
+            return None
+
+        callback, exception_types = self.callback, self.exception_types
+
+        if exception_types is None:
+            name, _ = _get_annotation(callback)
+            exception_types = get_type_hints(callback)[name]
+            self.exception_types = exception_types
+
         return (
-            self.callback(exception)  # type: ignore[arg-type]
-            if any(
-                isinstance(exception, exception_type)
-                for exception_type in self.exception_types
-            )
+            callback(exception)  # type: ignore[arg-type]
+            if isinstance(exception, exception_types)
             else None
         )
 
 
+def _get_annotation(callback: Callable[..., object]) -> Tuple[str, Any]:
+    """Return the name and type annotation of the parameter."""
+    try:
+        return next(
+            (key, hint)
+            for key, hint in getattr(callback, "__annotations__", {}).items()
+            if key != "return"
+        )
+    except StopIteration:
+        raise TypeError(f"missing type annotation on {callback}") from None
+
+
 def _exceptionhandler(
     *exception_types: Type[BaseException],
 ) -> Callable[[_Callback[E]], ExceptionHandler]:
@@ -281,14 +373,11 @@ def _exceptionhandler(
         if exception_types:
             return _Decorator(callback, *exception_types)
 
-        try:
-            exception_type = next(
-                hint
-                for key, hint in get_type_hints(callback).items()
-                if key != "return"
-            )
-        except StopIteration:
-            raise TypeError(f"missing type annotation on {callback}") from None
+        _, exception_type = _get_annotation(callback)
+
+        if isinstance(exception_type, str):
+            # Defer resolving forward references and postponed annotations.
+            return _Decorator(callback)
 
         return _Decorator(callback, exception_type)
 
@@ -1,6 +1,7 @@
 """Application cache."""
 import hashlib
 import json
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -27,8 +28,9 @@ class Cache:
         text = json.dumps(data)
         path = self.path / "token.json"
         path.parent.mkdir(exist_ok=True, parents=True)
-        path.touch(mode=0o600)
-        path.write_text(text)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, mode="w") as io:
+            io.write(text)
 
     def load_token(self) -> str:
         """Load a token."""
@@ -1,10 +1,13 @@
 """Application console."""
+import sys
+from types import TracebackType
 from typing import ContextManager
 from typing import Iterator
+from typing import Optional
+from typing import Type
 
 import rich.console
 import rich.theme
-import rich.traceback
 from rich.markup import escape
 
 from retrocookie.compat import contextlib
@@ -52,8 +55,7 @@ class Console:
 
     def highlight(self, text: str) -> None:
         """Output a text with highlighting."""
-        console = rich.console.Console(stderr=True)
-        console.print(text)
+        self.console.print(text, highlight=True)
 
     @contextlib.contextmanager
     def progress(self, message: str) -> Iterator[None]:
@@ -68,13 +70,25 @@ class Console:
 
 def start(*, bus: Bus) -> None:
     """Create the console and subscribe to events."""
-    rich.traceback.install()
+    sys.excepthook = _excepthook
 
     console = Console()
 
     _subscribe(console, bus)
 
 
+def _excepthook(
+    type_: Type[BaseException],
+    value: BaseException,
+    traceback: Optional[TracebackType],
+) -> None:
+    """Install rich tracebacks on first use, and display the exception."""
+    import rich.traceback
+
+    rich.traceback.install()
+    sys.excepthook(type_, value, traceback)
+
+
 def _subscribe(console: Console, bus: Bus) -> None:  # noqa: C901
     @bus.events.subscribe
     def _(event: events.GitNotFound) -> None:
@@ -105,9 +119,7 @@ def _subscribe(console: Console, bus: Bus) -> None:  # noqa: C901
                 output = getattr(event, stream)
                 if output:
                     yield ""
-                    for line in output.splitlines():
-                        line = escape(line)
-                        yield f"[{stream}]{line}[/]"
+                    yield f"[{stream}]{escape(output.rstrip())}[/]"
 
             yield ""
 
@@ -214,3 +226,8 @@ def _subscribe(console: Console, bus: Bus) -> None:  # noqa: C901
             f" [title]{escape(event.project_pull.title)}[/]"
             f" [pull]#{event.template_pull.number}[/]"
         )
+
+    @bus.events.subscribe
+    def _(event: events.BrowserFailed) -> None:
+        console.failure(f"Cannot open [repr.url]{event.url}[/] in a web browser")
+        console.highlight(event.error)
@@ -1,4 +1,5 @@
 """Import pull requests."""
+import re
 from typing import Collection
 from typing import Optional
 from urllib.parse import urlparse
@@ -14,16 +15,18 @@ from retrocookie.pr.list import list_pull_requests
 from retrocookie.pr.protocols import github
 from retrocookie.pr.protocols.retrocookie import Retrocookie
 from retrocookie.pr.repository import Repository
-from retrocookie.utils import removeprefix
 from retrocookie.utils import removesuffix
 
 
+# Abbreviated and scp-like URLs can be matched without parsing the URL.
+SHORTHAND_PATTERN = re.compile(r"(?:gh:|git@github\.com:)(?P<name>.*?)(?:\.git)?")
+
+
 def parse_repository_name(url: str) -> Optional[str]:
     """Extract the repository name from the URL, if possible."""
-    for prefix in ("gh:", "git@github.com:"):
-        if url.startswith(prefix):
-            path = removeprefix(url, prefix)
-            return removesuffix(path, ".git")
+    match = SHORTHAND_PATTERN.fullmatch(url)
+    if match is not None:
+        return match["name"]
 
     result = urlparse(url)
     if result.hostname == "github.com":
@@ -11,11 +11,15 @@ from retrocookie.pr.protocols import github
 class GitNotFound(bus.Event):
     """Cannot find an installation of git."""
 
+    __slots__ = ()
+
 
 @dataclass
 class BadGitVersion(bus.Event):
     """The installed version of git is too old."""
 
+    __slots__ = ("version", "expected")
+
     version: git.Version
     expected: git.Version
 
@@ -24,11 +28,15 @@ class BadGitVersion(bus.Event):
 class ProjectNotFound(bus.Event):
     """The generated project could not be identified."""
 
+    __slots__ = ()
+
 
 @dataclass
 class TemplateNotFound(bus.Event):
     """The project template could not be identified."""
 
+    __slots__ = ("project",)
+
     project: github.Repository
 
 
@@ -36,6 +44,8 @@ class TemplateNotFound(bus.Event):
 class LoadProject(bus.Context):
     """The project repository is being loaded."""
 
+    __slots__ = ("repository",)
+
     repository: str
 
 
@@ -43,6 +53,8 @@ class LoadProject(bus.Context):
 class LoadTemplate(bus.Context):
     """A template repository is being loaded."""
 
+    __slots__ = ("repository",)
+
     repository: str
 
 
@@ -50,6 +62,8 @@ class LoadTemplate(bus.Context):
 class RepositoryNotFound(bus.Event):
     """The repository was not found."""
 
+    __slots__ = ("repository",)
+
     repository: str
 
 
@@ -57,6 +71,8 @@ class RepositoryNotFound(bus.Event):
 class PullRequestNotFound(bus.Event):
     """The pull request was not found."""
 
+    __slots__ = ("pull_request",)
+
     pull_request: str
 
 
@@ -64,6 +80,8 @@ class PullRequestNotFound(bus.Event):
 class PullRequestAlreadyExists(bus.Event):
     """The pull request already exists."""
 
+    __slots__ = ("template", "template_pull", "project_pull")
+
     template: github.Repository
     template_pull: github.PullRequest
     project_pull: github.PullRequest
@@ -73,6 +91,8 @@ class PullRequestAlreadyExists(bus.Event):
 class GitFailed(bus.Event):
     """The git command exited with a non-zero status."""
 
+    __slots__ = ("command", "options", "status", "stdout", "stderr")
+
     command: str
     options: List[str]
     status: int
@@ -84,6 +104,8 @@ class GitFailed(bus.Event):
 class GitHubError(bus.Event):
     """The GitHub API returned an error response."""
 
+    __slots__ = ("url", "method", "code", "message", "errors")
+
     url: str
     method: str
     code: int
@@ -95,6 +117,8 @@ class GitHubError(bus.Event):
 class ConnectionError(bus.Event):
     """A connection to the GitHub API could not be established."""
 
+    __slots__ = ("url", "method", "error")
+
     url: str
     method: str
     error: str
@@ -104,6 +128,8 @@ class ConnectionError(bus.Event):
 class CreatePullRequest(bus.Context):
     """A pull request is being created."""
 
+    __slots__ = ("template", "template_branch", "project_pull")
+
     template: github.Repository
     template_branch: str
     project_pull: github.PullRequest
@@ -113,6 +139,8 @@ class CreatePullRequest(bus.Context):
 class UpdatePullRequest(bus.Context):
     """A pull request is being updated."""
 
+    __slots__ = ("template", "template_pull", "project_pull")
+
     template: github.Repository
     template_pull: github.PullRequest
     project_pull: github.PullRequest
@@ -122,6 +150,18 @@ class UpdatePullRequest(bus.Context):
 class PullRequestCreated(bus.Event):
     """A pull request was created."""
 
+    __slots__ = ("template", "template_pull", "project_pull")
+
     template: github.Repository
     template_pull: github.PullRequest
     project_pull: github.PullRequest
+
+
+@dataclass
+class BrowserFailed(bus.Event):
+    """A pull request could not be opened in a web browser."""
+
+    __slots__ = ("url", "error")
+
+    url: str
+    error: str
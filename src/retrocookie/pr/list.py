@@ -1,6 +1,7 @@
 """Listing pull requests."""
 import contextlib
 from typing import Collection
+from typing import Dict
 from typing import Iterator
 from typing import Optional
 
@@ -9,6 +10,11 @@ from retrocookie.pr.base.bus import Bus
 from retrocookie.pr.protocols import github
 
 
+# Up to this many pull requests are fetched individually. On busy repositories,
+# listing the open pull requests can take more API requests than that.
+MAX_DIRECT_LOOKUPS = 5
+
+
 def get_pull_request(
     repository: github.Repository,
     spec: str,
@@ -27,6 +33,32 @@ def get_pull_request(
     bus.events.raise_(events.PullRequestNotFound(spec))
 
 
+def find_pull_requests(
+    repository: github.Repository,
+    specs: Collection[str],
+) -> Dict[str, github.PullRequest]:
+    """Look up open pull requests by number, listing them only once.
+
+    Specs that are not found are omitted, and callers need to look them up
+    individually. The listing is only used for more than
+    :const:`MAX_DIRECT_LOOKUPS` numbers, because each page of the listing costs
+    as much as fetching one pull request directly.
+    """
+    numbers = {spec for spec in specs if spec.isdecimal()}
+    if len(numbers) <= MAX_DIRECT_LOOKUPS:
+        return {}
+
+    pulls: Dict[str, github.PullRequest] = {}
+    for pull in repository.pull_requests():
+        spec = str(pull.number)
+        if spec in numbers:
+            pulls[spec] = pull
+            if len(pulls) == len(numbers):
+                break
+
+    return pulls
+
+
 def get_pull_requests(
     repository: github.Repository,
     specs: Collection[str] = (),
@@ -35,8 +67,12 @@ def get_pull_requests(
 ) -> Iterator[github.PullRequest]:
     """Return pull requests. With specs, filter those matching specs."""
     if specs:
+        pulls = find_pull_requests(repository, specs)
         for spec in specs:
-            yield get_pull_request(repository, spec, bus=bus)
+            pull = pulls.get(spec)
+            if pull is None:
+                pull = get_pull_request(repository, spec, bus=bus)
+            yield pull
     else:
         yield from repository.pull_requests()
 
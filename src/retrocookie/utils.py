@@ -1,19 +1,24 @@
 """Utilities."""
 import os
+import sys
 from pathlib import Path
 from typing import Iterator
 
 from retrocookie.compat import contextlib
 
 
-def removeprefix(string: str, prefix: str) -> str:
-    """Remove prefix from string, if present."""
-    return string[len(prefix) :] if string.startswith(prefix) else string
+if sys.version_info >= (3, 9):
+    removeprefix = str.removeprefix
+    removesuffix = str.removesuffix
+else:
 
+    def removeprefix(string: str, prefix: str) -> str:
+        """Remove prefix from string, if present."""
+        return string[len(prefix) :] if string.startswith(prefix) else string
 
-def removesuffix(string: str, suffix: str) -> str:
-    """Remove suffix from string, if present."""
-    return string[: -len(suffix)] if suffix and string.endswith(suffix) else string
+    def removesuffix(string: str, suffix: str) -> str:
+        """Remove suffix from string, if present."""
+        return string[: -len(suffix)] if suffix and string.endswith(suffix) else string
 
 
 @contextlib.contextmanager
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 import textwrap
 from pathlib import Path
 from typing import Dict
@@ -15,21 +16,19 @@ if TYPE_CHECKING:
     from retrocookie import git
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def context() -> Dict[str, str]:
     """Cookiecutter context dictionary."""
     return {"project_slug": "example"}
 
 
-@pytest.fixture
-def cookiecutter_path(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def cookiecutter_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Cookiecutter path."""
-    path = tmp_path / "cookiecutter"
-    path.mkdir()
-    return path
+    return tmp_path_factory.mktemp("cookiecutter")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cookiecutter_json(cookiecutter_path: Path, context: Dict[str, str]) -> Path:
     """The cookiecutter.json file."""
     path = cookiecutter_path / "cookiecutter.json"
@@ -38,7 +37,7 @@ def cookiecutter_json(cookiecutter_path: Path, context: Dict[str, str]) -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cookiecutter_subdirectory(cookiecutter_path: Path) -> Path:
     """The template directory in the cookiecutter."""
     path = cookiecutter_path / "{{cookiecutter.project_slug}}"
@@ -46,7 +45,7 @@ def cookiecutter_subdirectory(cookiecutter_path: Path) -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cookiecutter_readme(cookiecutter_subdirectory: Path) -> Path:
     """The README file in the cookiecutter."""
     path = cookiecutter_subdirectory / "README.md"
@@ -59,7 +58,7 @@ def cookiecutter_readme(cookiecutter_subdirectory: Path) -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dot_cookiecutter_json(cookiecutter_subdirectory: Path) -> Path:
     """The .cookiecutter.json file in the cookiecutter."""
     path = cookiecutter_subdirectory / ".cookiecutter.json"
@@ -70,7 +69,7 @@ def dot_cookiecutter_json(cookiecutter_subdirectory: Path) -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cookiecutter_project(
     cookiecutter_path: Path,
     cookiecutter_json: Path,
@@ -91,25 +90,75 @@ def make_repository(path: Path) -> git.Repository:
     return repository
 
 
+def copy_repository(source: Path, path: Path) -> git.Repository:
+    """Copy a git repository, including its history."""
+    from retrocookie import git
+
+    shutil.copytree(source, path, symlinks=True)
+    return git.Repository(path)
+
+
+@pytest.fixture(scope="session")
+def cookiecutter_repository_prototype(
+    cookiecutter_project: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """The cookiecutter repository, created once per session."""
+    path = tmp_path_factory.mktemp("repository") / "cookiecutter"
+    shutil.copytree(cookiecutter_project, path)
+    return make_repository(path).path
+
+
 @pytest.fixture
-def cookiecutter_repository(cookiecutter_project: Path) -> git.Repository:
+def cookiecutter_repository(
+    cookiecutter_repository_prototype: Path, tmp_path: Path
+) -> git.Repository:
     """The cookiecutter repository."""
-    return make_repository(cookiecutter_project)
+    return copy_repository(cookiecutter_repository_prototype, tmp_path / "cookiecutter")
+
+
+@pytest.fixture(scope="session")
+def cookiecutter_instance_prototype(
+    cookiecutter_project: Path,
+    context: Dict[str, str],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """The cookiecutter instance, generated once per session."""
+    path = tmp_path_factory.mktemp("instance")
+    cookiecutter(str(cookiecutter_project), no_input=True, output_dir=str(path))
+    return path / context["project_slug"]
 
 
 @pytest.fixture
 def cookiecutter_instance(
-    cookiecutter_repository: git.Repository,
+    cookiecutter_instance_prototype: Path,
     context: Dict[str, str],
     tmp_path: Path,
 ) -> Path:
     """The cookiecutter instance."""
-    template = str(cookiecutter_repository.path)
-    cookiecutter(template, no_input=True, output_dir=str(tmp_path))
-    return tmp_path / context["project_slug"]
+    path = tmp_path / context["project_slug"]
+    shutil.copytree(cookiecutter_instance_prototype, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def cookiecutter_instance_repository_prototype(
+    cookiecutter_instance_prototype: Path,
+    context: Dict[str, str],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """The cookiecutter instance repository, created once per session."""
+    path = tmp_path_factory.mktemp("repository") / context["project_slug"]
+    shutil.copytree(cookiecutter_instance_prototype, path)
+    return make_repository(path).path
 
 
 @pytest.fixture
-def cookiecutter_instance_repository(cookiecutter_instance: Path) -> git.Repository:
+def cookiecutter_instance_repository(
+    cookiecutter_instance_repository_prototype: Path,
+    context: Dict[str, str],
+    tmp_path: Path,
+) -> git.Repository:
     """The cookiecutter instance repository."""
-    return make_repository(cookiecutter_instance)
+    return copy_repository(
+        cookiecutter_instance_repository_prototype, tmp_path / context["project_slug"]
+    )
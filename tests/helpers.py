@@ -42,6 +42,10 @@ def branch(
     """Switch to branch."""
     original = repository.get_current_branch()
 
+    if original == branch:
+        yield
+        return
+
     if create and not repository.exists_branch(branch):
         repository.create_branch(branch)
 
@@ -3,13 +3,13 @@ import json
 import os
 import secrets
 import time
-from itertools import count
 from pathlib import Path
 from typing import Callable
 from typing import Iterator
 
 import github3
 import pytest
+import tenacity
 from github3.pulls import PullRequest
 from github3.repos.repo import Repository
 
@@ -59,14 +59,17 @@ def create_repository(github: github3.GitHub) -> CreateRepository:
             has_wiki=False,
         )
 
-        for retry in count(start=1):
-            try:
+        # Poll with exponential backoff until the repository becomes visible.
+        for attempt in tenacity.Retrying(
+            reraise=True,
+            retry=tenacity.retry_if_exception_type(github3.exceptions.NotFoundError),
+            stop=tenacity.stop_after_attempt(5),
+            wait=tenacity.wait_exponential(
+                multiplier=0.5, max=GITHUB_REQUEST_RATE_SECONDS
+            ),
+        ):
+            with attempt:
                 return github.repository(owner, name)
-            except github3.exceptions.NotFoundError:
-                if retry >= 3:
-                    raise
-
-            time.sleep(GITHUB_REQUEST_RATE_SECONDS)
 
         raise AssertionError("unreachable")
 
@@ -126,6 +129,12 @@ def project(_project: Repository, template: Repository) -> Repository:
     return _project
 
 
+@session_fixture
+def project_default_sha(project: Repository) -> str:
+    """Return the commit at the tip of the project's default branch."""
+    return str(project.branch(project.default_branch).commit.sha)
+
+
 @pytest.fixture
 def branch() -> str:
     """Return a branch name that is unique for every test case."""
@@ -133,18 +142,36 @@ def branch() -> str:
     return f"branch-{random}"
 
 
+Throttle = Callable[[], None]
+
+
+@session_fixture
+def throttle() -> Throttle:
+    """Wait until the request rate allows creating another pull request."""
+    last = time.monotonic()
+
+    def _throttle() -> None:
+        nonlocal last
+        elapsed = time.monotonic() - last
+        time.sleep(max(0, GITHUB_REQUEST_RATE_SECONDS - elapsed))
+        last = time.monotonic()
+
+    return _throttle
+
+
 CreatePullRequest = Callable[[Path, str], PullRequest]
 
 
 @pytest.fixture
-def create_project_pull_request(project: Repository, branch: str) -> CreatePullRequest:
+def create_project_pull_request(
+    project: Repository, project_default_sha: str, branch: str, throttle: Throttle
+) -> CreatePullRequest:
     """Return a pull request for the template project."""
 
     def _create(path: Path, content: str) -> PullRequest:
-        time.sleep(GITHUB_REQUEST_RATE_SECONDS)
+        throttle()
 
-        project_default_branch = project.branch(project.default_branch)
-        project.create_ref(f"refs/heads/{branch}", project_default_branch.commit.sha)
+        project.create_ref(f"refs/heads/{branch}", project_default_sha)
 
         project_file = project.file_contents(str(path))
         project_file.update(
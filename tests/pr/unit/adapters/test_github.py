@@ -1,5 +1,7 @@
 """Tests for retrocookie.pr.github."""
 from typing import Any
+from typing import List
+from typing import Optional
 
 import github3.exceptions
 import pytest
@@ -8,6 +10,7 @@ import requests.exceptions
 from retrocookie.pr import events
 from retrocookie.pr.adapters import github
 from retrocookie.pr.base.bus import Bus
+from retrocookie.pr.list import MAX_DIRECT_LOOKUPS
 from tests.pr.unit.utils import raises
 
 
@@ -62,3 +65,180 @@ def test_errorhandler_connection_without_requests_exception(bus: Bus) -> None:
     with pytest.raises(github3.exceptions.ConnectionError):
         with github.errorhandler(bus=bus):
             raise github3.exceptions.ConnectionError(cause)
+
+
+class FakeUser:
+    """A fake for github3.users.AuthenticatedUser."""
+
+    def __init__(self, login: str) -> None:
+        """Initialize."""
+        self.login = login
+
+
+class FakeGitHub:
+    """A fake for github3.GitHub."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requests = 0
+
+    def repository(self, owner: str, name: str) -> object:
+        """Return a repository."""
+        self.requests += 1
+        return object()
+
+    def me(self) -> FakeUser:
+        """Return the authenticated user."""
+        self.requests += 1
+        return FakeUser("owner")
+
+
+def test_api_repository_cached(bus: Bus) -> None:
+    """It requests each repository only once."""
+    fake = FakeGitHub()
+    api = github.API(fake, token="token", bus=bus)  # noqa: S106
+
+    first = api.repository("owner", "name")
+    second = api.repository("owner", "name")
+
+    assert first is second
+    assert fake.requests == 1
+
+
+def test_api_me_cached(bus: Bus) -> None:
+    """It requests the authenticated user only once."""
+    fake = FakeGitHub()
+    api = github.API(fake, token="token", bus=bus)  # noqa: S106
+
+    assert api.me == api.me == "owner"
+    assert fake.requests == 1
+
+
+class FakeLabel:
+    """A fake for github3.issues.label.Label."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize."""
+        self.name = name
+
+
+class FakeIssue:
+    """A fake for github3.issues.Issue."""
+
+    def __init__(self, *labels: str) -> None:
+        """Initialize."""
+        self._labels = [FakeLabel(label) for label in labels]
+
+    def labels(self) -> List[FakeLabel]:
+        """Return the labels."""
+        return self._labels
+
+    def replace_labels(self, labels: List[str]) -> None:
+        """Replace the labels."""
+        self._labels = [FakeLabel(label) for label in labels]
+
+
+class FakePullRequest:
+    """A fake for github3.pulls.PullRequest."""
+
+    def __init__(self, issue: FakeIssue) -> None:
+        """Initialize."""
+        self._issue = issue
+        self.requests = 0
+
+    def issue(self) -> FakeIssue:
+        """Return the issue."""
+        self.requests += 1
+        return self._issue
+
+    def update(self, title: str, body: Optional[str]) -> None:
+        """Update the pull request."""
+
+
+def test_pull_request_labels_cached() -> None:
+    """It fetches the issue only once."""
+    fake = FakePullRequest(FakeIssue("bug"))
+    pull_request = github.PullRequest(fake)
+
+    pull_request.update("title", None, {"enhancement"})
+
+    assert {"enhancement"} == pull_request.labels
+    assert fake.requests == 1
+
+
+class FakeHead:
+    """A fake for github3.pulls.PullDestination."""
+
+    def __init__(self, label: str) -> None:
+        """Initialize."""
+        self.label = label
+
+
+class FakeShortPullRequest:
+    """A fake for github3.pulls.ShortPullRequest."""
+
+    def __init__(self, label: str) -> None:
+        """Initialize."""
+        self.head = FakeHead(label)
+
+
+class FakeRepository:
+    """A fake for github3.repos.repo.Repository."""
+
+    def __init__(self, *labels: str) -> None:
+        """Initialize."""
+        self._pull_requests = [FakeShortPullRequest(label) for label in labels]
+        self.requests = 0
+
+    def pull_request(self, number: int) -> FakePullRequest:
+        """Return the pull request."""
+        self.requests += 1
+        return FakePullRequest(FakeIssue())
+
+    def pull_requests(
+        self, state: str = "open", head: Optional[str] = None
+    ) -> List[FakeShortPullRequest]:
+        """Return the pull requests, optionally for the given head."""
+        self.requests += 1
+        return [
+            pull_request
+            for pull_request in self._pull_requests
+            if head is None or pull_request.head.label == head
+        ]
+
+
+def test_pull_request_by_head_cached(bus: Bus) -> None:
+    """It requests the pull requests for each head only once."""
+    fake = FakeRepository("owner:branch1", "owner:branch2")
+    repository = github.Repository(fake, token="token", bus=bus)  # noqa: S106
+
+    for _ in range(2):
+        assert repository.pull_request_by_head("owner:branch1") is not None
+        assert repository.pull_request_by_head("owner:branch3") is None
+
+    assert fake.requests == 2
+
+
+def test_pull_request_by_head_listed_once(bus: Bus) -> None:
+    """It lists the pull requests once when many heads are requested."""
+    heads = [f"owner:branch{index}" for index in range(MAX_DIRECT_LOOKUPS + 3)]
+    fake = FakeRepository(*heads[:-1])
+    repository = github.Repository(fake, token="token", bus=bus)  # noqa: S106
+
+    for head in heads[:-1]:
+        assert repository.pull_request_by_head(head) is not None
+
+    assert repository.pull_request_by_head(heads[-1]) is None
+    assert fake.requests == MAX_DIRECT_LOOKUPS + 1
+
+
+def test_pull_request_cached(bus: Bus) -> None:
+    """It requests each pull request only once."""
+    fake = FakeRepository()
+    repository = github.Repository(fake, token="token", bus=bus)  # noqa: S106
+
+    first = repository.pull_request(1)
+    second = repository.pull_request(1)
+
+    assert first is second
+    assert fake.requests == 1
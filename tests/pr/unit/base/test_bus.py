@@ -1,6 +1,7 @@
 """Tests for retrocookie.pr.bus."""
 import contextlib
 from typing import ContextManager
+from typing import Iterator
 
 import pytest
 
@@ -25,6 +26,42 @@ def test_events_publish() -> None:
     assert event is seen
 
 
+def test_events_publish_forward_reference() -> None:
+    """It resolves string annotations on the handler."""
+    events = []
+    bus = Bus()
+
+    @bus.events.subscribe
+    def handler(event: "Event") -> None:
+        events.append(event)
+
+    event = Event()
+    bus.events.publish(event)
+    [seen] = events
+    assert event is seen
+
+
+def test_events_publish_subclass() -> None:
+    """It invokes handlers for base classes of the event."""
+    events = []
+    bus = Bus()
+
+    class Derived(Event):
+        pass
+
+    @bus.events.subscribe
+    def handler(event: Event) -> None:
+        events.append(event)
+
+    @bus.events.subscribe
+    def derived_handler(event: Derived) -> None:
+        events.append(event)
+
+    event = Derived()
+    bus.events.publish(event)
+    assert [event, event] == events
+
+
 def test_contexts_publish() -> None:
     """It invokes the handler."""
     contexts = []
@@ -42,6 +79,46 @@ def test_contexts_publish() -> None:
     assert context is seen
 
 
+def test_contexts_publish_multiple() -> None:
+    """It enters the handlers in order and exits them in reverse order."""
+    calls = []
+    bus = Bus()
+
+    for name in ["first", "second"]:
+
+        @bus.contexts.subscribe
+        @contextlib.contextmanager
+        def handler(context: Context, name: str = name) -> Iterator[None]:
+            calls.append(f"enter {name}")
+            yield
+            calls.append(f"exit {name}")
+
+    with bus.contexts.publish(Context()):
+        pass
+
+    assert calls == ["enter first", "enter second", "exit second", "exit first"]
+
+
+def test_contexts_publish_subclass() -> None:
+    """It invokes handlers for base classes of the context."""
+    contexts = []
+    bus = Bus()
+
+    class Derived(Context):
+        pass
+
+    @bus.contexts.subscribe
+    def handler(context: Context) -> ContextManager[None]:
+        contexts.append(context)
+        return contextlib.nullcontext()
+
+    context = Derived()
+    with bus.contexts.publish(context):
+        pass
+    [seen] = contexts
+    assert context is seen
+
+
 def test_events_subscribe_without_annotations() -> None:
     """It fails when the handler has no type annotations."""
     bus = Bus()
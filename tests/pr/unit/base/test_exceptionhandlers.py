@@ -1,6 +1,10 @@
 """Tests for retrocookie.pr.exceptionhandlers."""
 from functools import reduce
+from types import TracebackType
+from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import Type
 from typing import Union
 
 import pytest
@@ -158,3 +162,139 @@ def test_compose_rshift(handlers: Tuple[ExceptionHandler]) -> None:
     handler = reduce(lambda a, b: a >> b, handlers)
     with handler:
         raise IndigoError()
+
+
+@pytest.mark.parametrize(
+    "handler",
+    [
+        nullhandler << suppress_indigo,
+        suppress_indigo << nullhandler,
+        nullhandler >> suppress_indigo,
+        suppress_indigo >> nullhandler,
+    ],
+)
+def test_compose_identity(handler: ExceptionHandler) -> None:
+    """Composing with nullhandler returns the other handler."""
+    assert handler is suppress_indigo
+
+
+@exceptionhandler
+def red_to_green(error: RedError) -> None:
+    """Replace RedError exceptions by GreenError."""
+    raise GreenError()
+
+
+@exceptionhandler
+def green_to_blue(error: GreenError) -> None:
+    """Replace GreenError exceptions by BlueError."""
+    raise BlueError()
+
+
+def test_compose_chaining() -> None:
+    """It chains exceptions raised by handlers like nested with blocks."""
+    with pytest.raises(BlueError) as exception_info:
+        with red_to_green >> green_to_blue:
+            raise RedError()
+
+    green = exception_info.value.__context__
+    assert isinstance(green, GreenError)
+    assert isinstance(green.__context__, RedError)
+
+
+def test_compose_suppress_raised() -> None:
+    """It suppresses exceptions raised by inner handlers."""
+    with red_to_green >> suppress_green:
+        raise RedError()
+
+
+@exceptionhandler
+def red_to_blue_via_green(error: RedError) -> None:
+    """Replace RedError exceptions by BlueError, while handling GreenError."""
+    try:
+        raise GreenError()
+    except GreenError as green:
+        raise BlueError() from green
+
+
+def test_compose_chaining_preserved() -> None:
+    """It keeps the exception context set up by the handler."""
+    with pytest.raises(BlueError) as exception_info:
+        with red_to_blue_via_green >> suppress_green:
+            raise RedError()
+
+    green = exception_info.value.__context__
+    assert isinstance(green, GreenError)
+    assert isinstance(green.__context__, RedError)
+
+
+class Tracker(ExceptionHandler):
+    """Exception handler that records entering and exiting."""
+
+    def __init__(self, calls: List[str], *, fail: bool = False) -> None:
+        """Initialize."""
+        self.calls = calls
+        self.fail = fail
+
+    def __enter__(self) -> None:
+        """Enter the runtime context."""
+        if self.fail:
+            raise RedError()
+        self.calls.append("enter")
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        """Exit the runtime context."""
+        self.calls.append("exit")
+        return None
+
+
+def test_compose_enter() -> None:
+    """It enters handlers that override __enter__."""
+    calls: List[str] = []
+
+    with Tracker(calls) >> suppress_red:
+        calls.append("body")
+
+    assert calls == ["enter", "body", "exit"]
+
+
+def test_compose_enter_failure() -> None:
+    """It exits entered handlers if a later handler fails to enter."""
+    calls: List[str] = []
+
+    with pytest.raises(RedError):
+        with Tracker(calls) << Tracker(calls, fail=True):
+            calls.append("body")
+
+    assert calls == ["enter", "exit"]
+
+
+def test_decorator_forward_reference() -> None:
+    """It resolves string annotations on the callback."""
+
+    @exceptionhandler
+    def suppress(error: "BlueError") -> bool:
+        return True
+
+    with suppress:
+        raise IndigoError()
+
+
+@exceptionhandler
+def suppress_late(error: "LateError") -> bool:
+    """Suppress exceptions of a type defined after the handler."""
+    return True
+
+
+class LateError(Exception):
+    """Exception type referenced before its definition."""
+
+
+def test_decorator_deferred_annotation() -> None:
+    """It resolves string annotations when the first exception is seen."""
+    with suppress_late:
+        raise LateError()
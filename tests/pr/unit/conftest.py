@@ -1,4 +1,5 @@
 """Fixtures for retrocookie.pr."""
+import functools
 import sys
 from pathlib import Path
 from typing import Callable
@@ -30,10 +31,20 @@ def cache(tmp_path: Path) -> Cache:
     return Cache(tmp_path / "cache")
 
 
+@pytest.fixture(scope="session")
+def repository_prototypes(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a directory for prototype repositories, shared by all tests.
+
+    Each repository name has its own prototype, so that the template and
+    the project do not share their root commit.
+    """
+    return tmp_path_factory.mktemp("prototypes")
+
+
 @pytest.fixture
-def api(tmp_path: Path) -> github.API:
+def api(tmp_path: Path, repository_prototypes: Path) -> github.API:
     """Return a fake GitHub API."""
-    return FakeAPI(_backend=tmp_path / "github")
+    return FakeAPI(_backend=tmp_path / "github", _prototypes=repository_prototypes)
 
 
 @pytest.fixture(name="retrocookie")
@@ -45,14 +56,12 @@ def fixture_retrocookie() -> Retrocookie:
 @pytest.fixture
 def repository(api: github.API, cache: Cache) -> Callable[[str], Repository]:
     """Return a repository factory."""
-
-    def _repository(fullname: str) -> Repository:
-        return Repository.load(fullname, api=api, cache=cache)
-
-    return _repository
+    return functools.partial(Repository.load, api=api, cache=cache)
 
 
-@pytest.fixture(autouse=sys.platform == "win32")
-def mock_cache_repository_path(monkeypatch: MonkeyPatch) -> None:
+@pytest.fixture(scope="session", autouse=sys.platform == "win32")
+def mock_cache_repository_path() -> Iterator[None]:
     """Avoid errors due to excessively long paths on Windows."""
-    monkeypatch.setattr("retrocookie.pr.cache.DIGEST_SIZE", 3)
+    with MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("retrocookie.pr.cache.DIGEST_SIZE", 3)
+        yield
@@ -1,19 +1,23 @@
 """Fake GitHub API."""
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import AbstractSet
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 from retrocookie import git
 
 
-@dataclass(order=True)
+@dataclass
 class PullRequest:
     """Fake pull request."""
 
@@ -25,6 +29,10 @@ class PullRequest:
     html_url: str = ""
     labels: Set[str] = dataclasses.field(default_factory=set)
 
+    def __lt__(self, other: PullRequest) -> bool:
+        """Order pull requests by number."""
+        return self.number < other.number
+
     def update(self, title: str, body: Optional[str], labels: AbstractSet[str]) -> None:
         """Update the pull request."""
         self.title = title
@@ -32,6 +40,13 @@ class PullRequest:
         self.labels = set(labels)
 
 
+def _init_repository(path: Path, full_name: str) -> git.Repository:
+    """Create a bare repository with an initial commit."""
+    repository = git.Repository.init(path, bare=True)
+    repository.commit(f"Initial commit of {full_name}")
+    return repository
+
+
 @dataclass
 class Repository:
     """Fake repository."""
@@ -43,18 +58,31 @@ class Repository:
 
     @classmethod
     def create(
-        cls, owner: str, name: str, _backend: Optional[Path] = None
+        cls,
+        owner: str,
+        name: str,
+        _backend: Optional[Path] = None,
+        _prototypes: Optional[Path] = None,
     ) -> Repository:
-        """Create a fake repository."""
+        """Create a fake repository.
+
+        Repositories are copied from prototypes of the same name, if a
+        directory for them is provided. Each name has a distinct root commit.
+        """
         if _backend is None:
             return cls(owner, name)
 
         path = _backend / owner / f"{name}.git"
         if path.exists():
             repository = git.Repository(path)
+        elif _prototypes is not None:
+            prototype = _prototypes / owner / f"{name}.git"
+            if not prototype.exists():
+                _init_repository(prototype, f"{owner}/{name}")
+            shutil.copytree(prototype, path, symlinks=True)
+            repository = git.Repository(path)
         else:
-            repository = git.Repository.init(path, bare=True)
-            repository.commit("Initial")
+            repository = _init_repository(path, f"{owner}/{name}")
 
         return cls(owner, name, _repository=repository)
 
@@ -130,7 +158,10 @@ class API:
     """Fake GitHub API."""
 
     _backend: Optional[Path] = None
-    _repositories: List[Repository] = dataclasses.field(default_factory=list)
+    _prototypes: Optional[Path] = None
+    _repositories: Dict[Tuple[str, str], Repository] = dataclasses.field(
+        default_factory=dict
+    )
 
     @property
     def me(self) -> str:
@@ -139,10 +170,11 @@ class API:
 
     def repository(self, owner: str, name: str) -> Repository:
         """Return the repository with the given owner and name."""
-        for repository in self._repositories:
-            if repository.owner == owner and repository.name == name:
-                return repository
+        with contextlib.suppress(KeyError):
+            return self._repositories[owner, name]
 
-        repository = Repository.create(owner, name, _backend=self._backend)
-        self._repositories.append(repository)
+        repository = Repository.create(
+            owner, name, _backend=self._backend, _prototypes=self._prototypes
+        )
+        self._repositories[owner, name] = repository
         return repository
@@ -1,4 +1,6 @@
 """Tests for retrocookie.pr.cache."""
+import stat
+import sys
 from pathlib import Path
 
 import pytest
@@ -56,6 +58,14 @@ def test_token_roundtrip(cache: Cache) -> None:
     assert "token" == cache.load_token()
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="no POSIX permissions")
+def test_token_permissions(cache: Cache) -> None:
+    """It saves the token with owner-only permissions."""
+    cache.save_token("token")
+    path = cache.path / "token.json"
+    assert 0o600 == stat.S_IMODE(path.stat().st_mode)
+
+
 def test_load_invalid_token(cache: Cache) -> None:
     """It rejects invalid tokens on load."""
     cache.save_token("token")
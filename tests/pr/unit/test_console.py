@@ -1,6 +1,7 @@
 """Tests for the console."""
 import contextlib
 import io
+import sys
 from typing import Callable
 from typing import Iterator
 from typing import Tuple
@@ -90,6 +91,9 @@ def get_class_name(instance: object) -> str:
         events.ConnectionError(
             "https://api.github.com/repos/owner/name", "GET", "pigeon unavailable"
         ),
+        events.BrowserFailed(
+            "https://github.com/owner/name/pull/1", "No browser found."
+        ),
     ],
     ids=get_class_name,
 )
@@ -149,3 +153,17 @@ def test_progress_failure() -> None:
             with c.progress("message"):
                 raise Exception("Boom")
     assert "⨯" in stderr.getvalue()
+
+
+def test_excepthook(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It installs rich tracebacks when the first exception is displayed."""
+    monkeypatch.setattr(sys, "excepthook", console._excepthook)
+
+    try:
+        raise Exception("Boom")
+    except Exception as error:
+        with redirect() as (stdout, stderr):
+            sys.excepthook(type(error), error, error.__traceback__)
+
+    assert sys.excepthook is not console._excepthook
+    assert "Boom" in stderr.getvalue()
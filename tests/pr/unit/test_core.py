@@ -1,14 +1,11 @@
 """Tests for retrocookie.pr.core."""
 import json
-import os
 from pathlib import Path
-from typing import Iterator
 
 import pytest
 from pytest import MonkeyPatch
 
 from retrocookie import git
-from retrocookie.compat import contextlib
 from retrocookie.pr import appname
 from retrocookie.pr import events
 from retrocookie.pr.base.bus import Bus
@@ -20,18 +17,22 @@ from retrocookie.pr.core import get_template_name
 from retrocookie.pr.core import import_pull_requests
 from retrocookie.pr.protocols import github
 from retrocookie.pr.repository import Repository
+from retrocookie.utils import chdir
 from tests.helpers import write
 from tests.pr.unit.fakes.retrocookie import retrocookie
 from tests.pr.unit.utils import raises
 
 
-def test_import(bus: Bus, cache: Cache, api: github.API) -> None:
-    """It imports the pull request."""
-    cache.save_token("token")
+@pytest.fixture
+def template(api: github.API, cache: Cache) -> Repository:
+    """Return the template repository."""
+    return Repository.load("owner/template", api=api, cache=cache)
 
-    template = Repository.load("owner/template", api=api, cache=cache)
-    project = Repository.load("owner/project", api=api, cache=cache)
 
+@pytest.fixture
+def project(api: github.API, cache: Cache) -> Repository:
+    """Return the project repository, with a pull request to be imported."""
+    project = Repository.load("owner/project", api=api, cache=cache)
     main = project.clone.get_current_branch()
 
     with cache.worktree(project.clone, main, force=True) as worktree:
@@ -48,11 +49,26 @@ def test_import(bus: Bus, cache: Cache, api: github.API) -> None:
             "# project",
         )
 
-    project.clone.git("push")
+    project.clone.repo.remotes["origin"].push(
+        [f"refs/heads/{main}", "refs/heads/readme"]
+    )
     project.github.create_pull_request(
         head="owner:readme", title="Add README.md", body="", labels=set()
     )
 
+    return project
+
+
+def test_import(
+    api: github.API,
+    bus: Bus,
+    cache: Cache,
+    template: Repository,
+    project: Repository,
+) -> None:
+    """It imports the pull request."""
+    cache.save_token("token")
+
     import_pull_requests(
         api=api,
         bus=bus,
@@ -72,6 +88,8 @@ def test_import_no_project_name(
     bus: Bus,
     cache: Cache,
     repository: git.Repository,
+    template: Repository,
+    project: Repository,
 ) -> None:
     """It derives the project name."""
     cache.save_token("token")
@@ -79,30 +97,6 @@ def test_import_no_project_name(
     repository.repo.remotes.create("origin", "git@github.com:owner/project.git")
 
     with chdir(repository.path):
-        template = Repository.load("owner/template", api=api, cache=cache)
-        project = Repository.load("owner/project", api=api, cache=cache)
-
-        main = project.clone.get_current_branch()
-
-        with cache.worktree(project.clone, main, force=True) as worktree:
-            write(
-                worktree,
-                Path(".cookiecutter.json"),
-                json.dumps({"_template": "gh:owner/template"}),
-            )
-
-        with cache.worktree(project.clone, "readme") as worktree:
-            write(
-                worktree,
-                Path("README.md"),
-                "# project",
-            )
-
-        project.clone.git("push")
-        project.github.create_pull_request(
-            head="owner:readme", title="Add README.md", body="", labels=set()
-        )
-
         import_pull_requests(
             api=api,
             bus=bus,
@@ -111,9 +105,9 @@ def test_import_no_project_name(
             retrocookie=retrocookie,
         )
 
-        [pull_request] = template.github.pull_requests()
+    [pull_request] = template.github.pull_requests()
 
-        assert pull_request.branch == f"{appname}/readme"
+    assert pull_request.branch == f"{appname}/readme"
 
 
 @pytest.fixture
@@ -122,21 +116,12 @@ def repository(tmp_path: Path) -> git.Repository:
     return git.Repository.init(tmp_path / "repository")
 
 
-@contextlib.contextmanager
-def chdir(path: Path) -> Iterator[None]:
-    """Change the directory temporarily."""
-    cwd = Path.cwd()
-    os.chdir(path)
-    try:
-        yield
-    finally:
-        os.chdir(cwd)
-
-
 @pytest.mark.parametrize(
     "remote",
     [
+        "gh:owner/name",
         "git@github.com:owner/name.git",
+        "git@github.com:owner/name",
         "https://github.com/owner/name.git",
         "https://github.com/owner/name",
     ],
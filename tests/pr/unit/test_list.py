@@ -7,14 +7,15 @@ import pytest
 
 from retrocookie.pr.base.bus import Bus
 from retrocookie.pr.list import list_pull_requests
+from retrocookie.pr.list import MAX_DIRECT_LOOKUPS
 from retrocookie.pr.protocols.github import PullRequest as AbstractPullRequest
 from tests.pr.unit.fakes import github
 
 
 @pytest.fixture
-def repository(api: github.API) -> github.Repository:
-    """Return a fake repository."""
-    return api.repository("owner", "name")
+def repository() -> github.Repository:
+    """Return a fake repository without a git backend."""
+    return github.Repository.create("owner", "name")
 
 
 pr1 = github.PullRequest(1, "title1", "body1", "branch1", "user1")
@@ -89,6 +90,31 @@ def test_list_by_number(
     assert equal(expected, actual)
 
 
+def test_list_by_numbers_without_lookups(
+    repository: github.Repository, bus: Bus, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It finds many pull requests in a single listing."""
+    pulls = [
+        github.PullRequest(number, "title", "body", f"branch{number}", "user")
+        for number in range(1, MAX_DIRECT_LOOKUPS + 2)
+    ]
+    repository._pull_requests = pulls
+    monkeypatch.setattr(repository, "pull_request", None)
+    specs = [str(pull.number) for pull in reversed(pulls)]
+    actual = list_pull_requests(repository, specs, bus=bus)
+    assert pulls[::-1] == list(actual)
+
+
+def test_list_by_numbers_without_listing(
+    repository: github.Repository, bus: Bus, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It looks up a few pull requests individually."""
+    repository._pull_requests = [pr1, pr2]
+    monkeypatch.setattr(repository, "pull_requests", None)
+    actual = list_pull_requests(repository, ["2", "1"], bus=bus)
+    assert [pr2, pr1] == list(actual)
+
+
 @pytest.mark.parametrize(
     "pull_requests, specs, expected",
     [
@@ -1,6 +1,11 @@
 """Tests for retrocookie.pr.__main__."""
 import subprocess  # noqa: S404
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 from typing import List
+from typing import Union
 
 import pytest
 from click.testing import CliRunner
@@ -91,9 +96,10 @@ def test_open_after_create(bus: Bus, monkeypatch: MonkeyPatch) -> None:
 
     monkeypatch.setattr("webbrowser.open", _webbrowser_open)
 
-    __main__.register_pull_request_viewer(bus=bus)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        __main__.register_pull_request_viewer(bus=bus, executor=executor)
 
-    bus.events.publish(event)
+        bus.events.publish(event)
 
     assert urls == [event.template_pull.html_url]
 
@@ -113,9 +119,85 @@ def test_open_after_update(bus: Bus, monkeypatch: MonkeyPatch) -> None:
 
     monkeypatch.setattr("webbrowser.open", _webbrowser_open)
 
-    __main__.register_pull_request_viewer(bus=bus)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        __main__.register_pull_request_viewer(bus=bus, executor=executor)
 
-    with bus.contexts.publish(event):
-        pass
+        with bus.contexts.publish(event):
+            pass
 
     assert urls == [event.template_pull.html_url]
+
+
+@pytest.mark.parametrize(
+    "result,expected",
+    [
+        (RuntimeError("pigeon unavailable"), "pigeon unavailable"),
+        (False, "No browser found."),
+    ],
+)
+def test_open_failure(
+    bus: Bus,
+    monkeypatch: MonkeyPatch,
+    result: Union[bool, Exception],
+    expected: str,
+) -> None:
+    """It reports failures to launch the browser on the bus."""
+    event = events.PullRequestCreated(
+        EXAMPLE_TEMPLATE,
+        EXAMPLE_TEMPLATE_PULL,
+        EXAMPLE_PROJECT_PULL,
+    )
+
+    def _webbrowser_open(url: str) -> bool:
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr("webbrowser.open", _webbrowser_open)
+
+    failures = []
+
+    @bus.events.subscribe
+    def _(event: events.BrowserFailed) -> None:
+        failures.append(event)
+
+    with __main__.pull_request_viewer(bus=bus):
+        bus.events.publish(event)
+
+    assert failures == [events.BrowserFailed(event.template_pull.html_url, expected)]
+
+
+def test_main_open(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """It launches the browser and shuts down the worker before exiting."""
+    shutdowns: List[bool] = []
+    urls: List[str] = []
+
+    class _ThreadPoolExecutor(ThreadPoolExecutor):
+        def shutdown(self, wait: bool = True, **kwargs: Any) -> None:
+            super().shutdown(wait, **kwargs)
+            shutdowns.append(wait)
+
+    def _import_pull_requests(*args: Any, bus: Bus, **kwargs: Any) -> None:
+        bus.events.publish(
+            events.PullRequestCreated(
+                EXAMPLE_TEMPLATE,
+                EXAMPLE_TEMPLATE_PULL,
+                EXAMPLE_PROJECT_PULL,
+            )
+        )
+
+    monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+    monkeypatch.setattr("appdirs.user_cache_dir", lambda **kwargs: str(tmp_path))
+    monkeypatch.setattr(__main__, "ThreadPoolExecutor", _ThreadPoolExecutor)
+    monkeypatch.setattr(__main__, "import_pull_requests", _import_pull_requests)
+    monkeypatch.setattr(
+        "retrocookie.pr.adapters.github.API.login", lambda token, bus: None
+    )
+    monkeypatch.setattr("webbrowser.open", urls.append)
+
+    runner = CliRunner()
+    result = runner.invoke(__main__.main, ["--open", "--token=token", "1"])
+
+    assert result.exit_code == 0
+    assert urls == [EXAMPLE_TEMPLATE_PULL.html_url]
+    assert shutdowns == [True]
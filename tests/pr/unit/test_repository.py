@@ -8,3 +8,15 @@ def test_repository(api: github.API, cache: Cache) -> None:
     """It loads the repository."""
     repository = Repository.load("owner/name", api=api, cache=cache)
     assert repository.clone.path.exists()
+
+
+def test_repository_unrelated(api: github.API, cache: Cache) -> None:
+    """It does not share history between fake repositories."""
+    template = Repository.load("owner/template", api=api, cache=cache)
+    project = Repository.load("owner/project", api=api, cache=cache)
+
+    roots = {
+        repository.clone.repo.revparse_single("HEAD").id
+        for repository in (template, project)
+    }
+    assert len(roots) == 2
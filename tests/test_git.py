@@ -131,6 +131,25 @@ def test_cherrypick_worktree(repository: git.Repository) -> None:
     assert (repository.path / install).exists()
 
 
+def test_cherrypick_multiple(repository: git.Repository) -> None:
+    """It applies a chain of commits on top of each other."""
+    readme, install = map(Path, ("README", "INSTALL"))
+
+    commit(repository)
+
+    with branch(repository, "topic", create=True):
+        first = touch(repository, readme)
+        second = write(repository, readme, "a")
+        third = touch(repository, install)
+
+    repository.cherrypick(first, second, third)
+
+    assert "a" == repository.read_text(readme)
+    assert repository.exists(install)
+    base = repository.repo.revparse_single("topic~3")
+    assert base.id == repository.repo.revparse_single("HEAD~3").id
+
+
 def test_cherrypick_conflict(repository: git.Repository) -> None:
     """It raises an exception if the cherry-pick results in conflicts."""
     path = Path("README")
@@ -146,6 +165,109 @@ def test_cherrypick_conflict(repository: git.Repository) -> None:
         repository.cherrypick("topic")
 
 
+def test_cherrypick_conflict_resolvable(repository: git.Repository) -> None:
+    """It keeps clean commits and leaves conflicts for manual resolution."""
+    readme, install = map(Path, ("README", "INSTALL"))
+
+    touch(repository, readme)
+
+    with branch(repository, "topic", create=True):
+        first = touch(repository, install)
+        second = write(repository, readme, "a")
+
+    write(repository, readme, "b")
+
+    with pytest.raises(git.CommandError):
+        repository.cherrypick(first, second)
+
+    assert repository.exists(install)
+    assert "CHERRY_PICK_HEAD" in repository.repo.references
+    assert "<<<<<<<" in (repository.path / readme).read_text()
+
+
+def test_cherrypick_range(repository: git.Repository) -> None:
+    """It applies the commits in a range."""
+    readme, install = map(Path, ("README", "INSTALL"))
+
+    commit(repository)
+
+    with branch(repository, "topic", create=True):
+        touch(repository, readme)
+        touch(repository, install)
+
+    repository.cherrypick("topic~1..topic")
+
+    assert repository.exists(install)
+    assert not repository.exists(readme)
+
+
+def test_cherrypick_annotated_tag(repository: git.Repository) -> None:
+    """It applies the commit pointed to by an annotated tag."""
+    path = Path("README")
+
+    commit(repository)
+
+    with branch(repository, "topic", create=True):
+        touch(repository, path)
+
+    repository.git("tag", "--annotate", "--message=Tag", "v1.0.0", "topic")
+    repository.cherrypick("v1.0.0")
+
+    assert repository.exists(path)
+
+
+def test_cherrypick_invalid(repository: git.Repository) -> None:
+    """It raises CommandError for invalid revisions."""
+    commit(repository)
+
+    with pytest.raises(git.CommandError):
+        repository.cherrypick("HEAD^{bogus}")
+
+
+def test_cherrypick_empty(repository: git.Repository) -> None:
+    """It raises an exception if the changes are already applied."""
+    path = Path("README")
+
+    touch(repository, path)
+
+    with branch(repository, "topic", create=True):
+        write(repository, path, "a")
+
+    write(repository, path, "a")
+
+    with pytest.raises(git.CommandError, match="empty"):
+        repository.cherrypick("topic")
+
+
+def test_cherrypick_merge(repository: git.Repository) -> None:
+    """It raises an exception if the commit is a merge."""
+    commit(repository)
+
+    with branch(repository, "topic", create=True):
+        touch(repository, Path("README"))
+
+    with branch(repository, "merged", create=True):
+        repository.git("merge", "--no-ff", "--no-edit", "topic")
+
+    with pytest.raises(git.CommandError, match="merge"):
+        repository.cherrypick("merged")
+
+
+def test_cherrypick_dirty_worktree(repository: git.Repository) -> None:
+    """It raises CommandError if the worktree cannot be updated."""
+    path = Path("README")
+
+    touch(repository, path)
+
+    with branch(repository, "topic", create=True):
+        write(repository, path, "a")
+
+    (repository.path / path).write_text("b")
+
+    with pytest.raises(git.CommandError):
+        repository.cherrypick("topic")
+
+
 def test_parse_revisions(repository: git.Repository) -> None:
     """It returns the hashes on topic for the range expression ``..topic``."""
     commit(repository)
@@ -158,6 +280,21 @@ def test_parse_revisions(repository: git.Repository) -> None:
     assert revisions == expected
 
 
+def test_parse_revisions_single(repository: git.Repository) -> None:
+    """It resolves single revisions in the same order as git rev-list."""
+    commit(repository)
+    second = commit(repository)
+
+    with branch(repository, "topic", create=True):
+        commit(repository)
+
+    args = ["topic", f"{second}^", "HEAD"]
+    expected = repository.git("rev-list", "--no-walk", *args).stdout.split()
+    expected.reverse()
+
+    assert expected == repository.parse_revisions(*args)
+
+
 def test_lookup_replacement(repository: git.Repository) -> None:
     """It returns the replacement ref for a replaced ref."""
     first, second = commit(repository), commit(repository)
@@ -216,6 +353,16 @@ def test_worktree(repository: git.Repository, tmp_path: Path) -> None:
     assert not path.exists()
 
 
+def test_version_cached(monkeypatch: MonkeyPatch) -> None:
+    """It invokes git only once."""
+    git.version.cache_clear()
+    expected = git.version()
+
+    monkeypatch.setattr(git, "git", None)
+
+    assert expected == git.version()
+
+
 @pytest.mark.parametrize(
     "version,expected",
     [